@@ -48,8 +48,13 @@ class ContactAdmin(admin.ModelAdmin):
         "api_id",
         "created_at",
     )
+    list_select_related = ("owner",)
+    raw_id_fields = ("owner",)
     ordering = ["-id"]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer("api_log")
+
 
 @admin.register(models.Domain)
 class DomainAdmin(admin.ModelAdmin):
@@ -60,8 +65,13 @@ class DomainAdmin(admin.ModelAdmin):
         "owner",
         "created_at",
     )
+    list_select_related = ("contact", "owner")
+    raw_id_fields = ("contact", "owner")
     ordering = ["-id"]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer("api_log", "contact__api_log")
+
 
 @admin.register(models.Checkout)
 class CheckoutAdmin(admin.ModelAdmin):
@@ -70,4 +80,6 @@ class CheckoutAdmin(admin.ModelAdmin):
         "domain",
         "created_at",
     )
+    list_select_related = ("domain",)
+    raw_id_fields = ("domain",)
     ordering = ["-id"]
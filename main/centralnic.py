@@ -1,3 +1,6 @@
+import re
+from collections import defaultdict
+
 import httpx
 from django.conf import settings
 
@@ -5,12 +8,41 @@ from django.conf import settings
 BASE_URL = settings.CENTRALNIC_ENDPOINT
 USERNAME = settings.CENTRALNIC_USERNAME
 PASSWORD = settings.CENTRALNIC_PASSWORD
+TIMEOUT = 30.0
+
+# sent with every request by both the sync and the async client
+AUTH_PARAMS = {"s_login": USERNAME, "s_pw": PASSWORD}
+
+# shared client so that consecutive calls reuse the same keep-alive connection
+_client = httpx.Client(params=AUTH_PARAMS, timeout=TIMEOUT)
+
+# matches response lines like 'property[nameserver][1] = NS2.EXAMPLE.COM'
+PROPERTY_RE = re.compile(r"^property\[([^\]]+)\](?:\[(\d+)\])? = (.*)$")
+
+# contact model field -> CentralNIC property name
+CONTACT_PROPERTY_NAMES = {
+    "first_name": "first name",
+    "last_name": "last name",
+    "email": "email",
+    "phone": "phone",
+    "street": "street",
+    "city": "city",
+    "postal": "zip",
+    "country": "country",
+}
+
+
+def async_client():
+    """Return an async client for fanning out concurrent API calls.
+
+    With HTTP/2 the concurrent requests are multiplexed as streams over a
+    single connection instead of each opening their own.
+    """
+    return httpx.AsyncClient(params=AUTH_PARAMS, timeout=TIMEOUT, http2=True)
 
 
 def create_contact(contact):
     params = {
-        "s_login": USERNAME,
-        "s_pw": PASSWORD,
         "command": "AddContact",
         "firstname": contact.first_name,
         "lastname": contact.last_name,
@@ -24,7 +56,7 @@ def create_contact(contact):
         # "preverify=1",
         # "new=1",
     }
-    req = httpx.get(BASE_URL, params=params)
+    req = _client.get(BASE_URL, params=params)
 
     if req.status_code != 200:
         raise Exception("centralnic API for contact creation failed")
@@ -55,27 +87,25 @@ def create_contact(contact):
     #  ]
     api_response = req.content.decode("utf-8")
     contact.api_log = api_response
-    contact.save()
-
-    # save API id on contact object separately
     api_response = api_response.split("\n")
 
-    # check for errors
+    # check for errors, keeping the API log for inspection
     if api_response[0] != "[RESPONSE]":
+        contact.save(update_fields=["api_log", "updated_at"])
         raise Exception("centralnic API for contact creation unexpected error")
     if api_response[1] != "code = 200":
+        contact.save(update_fields=["api_log", "updated_at"])
         raise Exception(
             f"centralnic API for contact creation error: {api_response[1]} {api_response[2]}"
         )
 
+    # save API log and API id in a single write
     contact.api_id = api_response[6].split(" ")[2]
-    contact.save()
+    contact.save(update_fields=["api_log", "api_id", "updated_at"])
 
 
 def register_domain(domain):
     params = {
-        "s_login": USERNAME,
-        "s_pw": PASSWORD,
         "command": "AddDomain",
         "domain": domain.domain_name,
         "period": "1",
@@ -83,21 +113,18 @@ def register_domain(domain):
         "admincontact0": domain.contact.api_id,
         "techcontact0": domain.contact.api_id,
         "billingcontact0": domain.contact.api_id,
-        "nameserver0": domain.nameserver0,
-        "nameserver1": domain.nameserver1,
-        "nameserver2": domain.nameserver2,
-        "nameserver3": domain.nameserver3,
     }
-    req = httpx.get(BASE_URL, params=params)
+    for index, nameserver in enumerate(domain.nameservers):
+        params[f"nameserver{index}"] = nameserver
+    req = _client.get(BASE_URL, params=params)
 
     if req.status_code != 200:
         raise Exception("centralnic API for domain creation failed")
 
     api_response = req.content.decode("utf-8")
     domain.api_log = api_response
-    domain.save()
+    domain.save(update_fields=["api_log", "updated_at"])
 
-    # save API id on domain object separately
     api_response = api_response.split("\n")
 
     # check for errors
@@ -106,50 +133,50 @@ def register_domain(domain):
     if api_response[1] != "code = 200":
         raise Exception(f"centralnic API for domain creation error: {api_response[1]}")
 
+    # domain has no api_id column, so this is only kept on the instance
     domain.api_id = api_response[6].split(" ")[2]
-    domain.save()
 
 
 def get_contact_list():
     params = {
-        "s_login": USERNAME,
-        "s_pw": PASSWORD,
         "command": "QueryContactList",
     }
-    req = httpx.get(BASE_URL, params=params)
+    with _client.stream("GET", BASE_URL, params=params) as req:
+        if req.status_code != 200:
+            raise Exception("centralnic API for contact list failed")
 
-    if req.status_code != 200:
-        raise Exception("centralnic API for contact list failed")
+        # parse lines as they arrive instead of buffering the whole body
+        api_response = req.iter_lines()
 
-    api_response = req.content.decode("utf-8")
-    api_response = api_response.split("\n")
+        # check for errors
+        if next(api_response, None) != "[RESPONSE]":
+            raise Exception("centralnic API for contact list unexpected error")
+        status = next(api_response, None)
+        if status != "code = 200":
+            raise Exception(f"centralnic API for contact list error: {status}")
 
-    # check for errors
-    if api_response[0] != "[RESPONSE]":
-        raise Exception("centralnic API for contact list unexpected error")
-    if api_response[1] != "code = 200":
-        raise Exception(f"centralnic API for contact list error: {api_response[1]}")
+        return _parse_properties(api_response)["contact"]
 
-    # parse
-    contact_list = []
-    for entry in api_response:
-        key = "property[contact]"
-        if len(entry) >= len(key) and entry[: len(key)] == key:
-            contact_api_id = entry.split(" = ")[1]
-            contact_list.append(contact_api_id)
 
-    return contact_list
+def get_contact_info(contact_api_id):
+    params = {
+        "command": "StatusContact",
+        "contact": contact_api_id,
+    }
+    req = _client.get(BASE_URL, params=params)
+    return _parse_contact_info(req, contact_api_id)
 
 
-def get_contact_info(contact_api_id):
+async def get_contact_info_async(client, contact_api_id):
     params = {
-        "s_login": USERNAME,
-        "s_pw": PASSWORD,
         "command": "StatusContact",
         "contact": contact_api_id,
     }
-    req = httpx.get(BASE_URL, params=params)
+    req = await client.get(BASE_URL, params=params)
+    return _parse_contact_info(req, contact_api_id)
+
 
+def _parse_contact_info(req, contact_api_id):
     if req.status_code != 200:
         raise Exception("centralnic API for contact status failed")
 
@@ -163,85 +190,61 @@ def get_contact_info(contact_api_id):
         raise Exception(f"centralnic API for domain status error: {api_response[1]}")
 
     # parse
-    contact_object = {}
-    for entry in api_response:
-        contact_object["api_id"] = contact_api_id
-        api_property_names = {
-            "first_name": "property[first name]",
-            "last_name": "property[last name]",
-            "email": "property[email]",
-            "phone": "property[phone]",
-            "street": "property[street]",
-            "city": "property[city]",
-            "postal": "property[zip]",
-            "country": "property[country]",
-        }
-        for db_property, api_property in api_property_names.items():
-            if (
-                len(entry) >= len(api_property)
-                and entry[: len(api_property)] == api_property
-            ):
-                contact_object[db_property] = entry.split(" = ")[1]
+    properties = _parse_properties(api_response)
+    contact_object = {"api_id": contact_api_id}
+    for db_property, api_property in CONTACT_PROPERTY_NAMES.items():
+        if api_property in properties:
+            contact_object[db_property] = properties[api_property][0]
 
     return contact_object
 
 
 def get_domain_list():
     params = {
-        "s_login": USERNAME,
-        "s_pw": PASSWORD,
         "command": "QueryDomainList",
     }
-    req = httpx.get(BASE_URL, params=params)
-
-    if req.status_code != 200:
-        raise Exception("centralnic API for domain list failed")
-
-    # example response:
-    # [
-    #     '[RESPONSE]',
-    #     'code = 200',
-    #     'description = Command completed successfully',
-    #     'queuetime = 0',
-    #     'runtime = 0.003',
-    #     'property[column][0] = domain',
-    #     'property[count][0] = 2',
-    #     'property[domain][0] = oddbroccoli.com',
-    #     'property[domain][1] = tofunames.com',
-    #     'property[first][0] = 0',
-    #     'property[last][0] = 1',
-    #     'property[limit][0] = 1000',
-    #     'property[total][0] = 2',
-    #     'EOF',
-    #     ''
-    # ]
-    api_response = req.content.decode("utf-8")
-    api_response = api_response.split("\n")
-
-    # check for errors
-    if api_response[0] != "[RESPONSE]":
-        raise Exception("centralnic API for domain list unexpected error")
-    if api_response[1] != "code = 200":
-        raise Exception(f"centralnic API for domain list error: {api_response[1]}")
-
-    # parse domain names
-    domain_list = []
-    for entry in api_response:
-        if len(entry) > 16 and entry[:16] == "property[domain]":
-            domain_name = entry.split(" = ")[1]
-            domain_list.append(domain_name)
-
-    return domain_list
+    with _client.stream("GET", BASE_URL, params=params) as req:
+        if req.status_code != 200:
+            raise Exception("centralnic API for domain list failed")
+
+        # example response:
+        # [
+        #     '[RESPONSE]',
+        #     'code = 200',
+        #     'description = Command completed successfully',
+        #     'queuetime = 0',
+        #     'runtime = 0.003',
+        #     'property[column][0] = domain',
+        #     'property[count][0] = 2',
+        #     'property[domain][0] = oddbroccoli.com',
+        #     'property[domain][1] = tofunames.com',
+        #     'property[first][0] = 0',
+        #     'property[last][0] = 1',
+        #     'property[limit][0] = 1000',
+        #     'property[total][0] = 2',
+        #     'EOF',
+        #     ''
+        # ]
+
+        # parse lines as they arrive instead of buffering the whole body
+        api_response = req.iter_lines()
+
+        # check for errors
+        if next(api_response, None) != "[RESPONSE]":
+            raise Exception("centralnic API for domain list unexpected error")
+        status = next(api_response, None)
+        if status != "code = 200":
+            raise Exception(f"centralnic API for domain list error: {status}")
+
+        return _parse_properties(api_response)["domain"]
 
 
 def get_domain_info(domain_name):
     params = {
-        "s_login": USERNAME,
-        "s_pw": PASSWORD,
         "command": "StatusDomain",
         "domain": domain_name,
     }
-    req = httpx.get(BASE_URL, params=params)
+    req = _client.get(BASE_URL, params=params)
 
     if req.status_code != 200:
         raise Exception("centralnic API for contact creation failed")
@@ -291,17 +294,26 @@ def get_domain_info(domain_name):
         raise Exception(f"centralnic API for domain creation error: {api_response[1]}")
 
     # parse
+    properties = _parse_properties(api_response)
     domain_object = {
-        "nameserver_list": [],
+        "nameserver_list": [ns.lower() for ns in properties["nameserver"]],
     }
-    for entry in api_response:
-        key = "property[nameserver]"
-        if len(entry) >= len(key) and entry[: len(key)] == key:
-            nameserver = entry.split(" = ")[1].lower()
-            domain_object["nameserver_list"].append(nameserver)
-
-        key = "property[owner contact][0]"
-        if len(entry) >= len(key) and entry[: len(key)] == key:
-            domain_object["contact_api_id"] = entry.split(" = ")[1]
+    if "owner contact" in properties:
+        domain_object["contact_api_id"] = properties["owner contact"][0]
 
     return domain_object
+
+
+def _parse_properties(api_response):
+    """Map every property name of a response to its values, in index order.
+
+    For example, 'property[nameserver][1] = NS2.EXAMPLE.COM' is appended to
+    properties["nameserver"].
+    """
+    properties = defaultdict(list)
+    for entry in api_response:
+        match = PROPERTY_RE.match(entry)
+        if match:
+            name, _, value = match.groups()
+            properties[name].append(value)
+    return properties
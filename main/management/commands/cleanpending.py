@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+import stripe
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from main import models
+
+# stripe checkout sessions expire after a day by default
+STALE_AFTER = timedelta(days=1)
+
+
+class Command(BaseCommand):
+    help = "Delete pending domains, and their checkouts, of abandoned payments"
+
+    def handle(self, *args, **options):
+        stripe.api_key = settings.STRIPE_API_KEY
+        cutoff = timezone.now() - STALE_AFTER
+
+        # only checkouts whose stripe session expired unpaid are abandoned,
+        # paid ones still pending failed to register and are kept
+        abandoned = []
+        checkouts = models.Checkout.objects.filter(
+            domain__pending=True, created_at__lt=cutoff
+        ).only("domain_id", "stripe_session_id")
+        for checkout in checkouts:
+            if not checkout.stripe_session_id:
+                print(f"Kept, no Stripe session: domain {checkout.domain_id}")
+                continue
+            try:
+                session = stripe.checkout.Session.retrieve(checkout.stripe_session_id)
+            except stripe.StripeError as e:
+                # e.g. a session of the other mode's keys, or a network error;
+                # the rest are still cleaned up
+                print(f"Kept, {e.__class__.__name__}: domain {checkout.domain_id}: {e}")
+                continue
+            if session.status == "expired" and session.payment_status == "unpaid":
+                abandoned.append(checkout.domain_id)
+            else:
+                print(f"Kept, {session.payment_status}: domain {checkout.domain_id}")
+
+        # the checkouts go in one statement, the domains in another
+        stale = models.Domain.objects.filter(pk__in=abandoned, pending=True)
+        _, per_model = stale.only("id").delete()
+
+        print(f"Deleted: {per_model}")
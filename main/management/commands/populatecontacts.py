@@ -1,10 +1,35 @@
+import asyncio
 import logging
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from main import centralnic, models
 
+try:
+    # faster event loop for the concurrent CentralNIC calls, when installed
+    from uvloop import run as run_async
+except ImportError:
+    from asyncio import run as run_async
+
 logger = logging.getLogger(__name__)
 
+# upper bound of in-flight requests to CentralNIC
+CONCURRENCY = 8
+
+BATCH_SIZE = 500
+
+
+async def gather_contacts(contact_list):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async with centralnic.async_client() as client:
+
+        async def fetch(contact_api_id):
+            async with semaphore:
+                return await centralnic.get_contact_info_async(client, contact_api_id)
+
+        return await asyncio.gather(*[fetch(c) for c in contact_list])
+
 
 class Command(BaseCommand):
     help = "Populate contacts from CentralNIC"
@@ -13,8 +38,15 @@ class Command(BaseCommand):
         contact_list = centralnic.get_contact_list()
         print(f"Contact list: {contact_list}")
 
+        contact_objects = run_async(gather_contacts(contact_list))
+
+        # all batches are written in a single transaction
+        with transaction.atomic():
+            contacts = models.Contact.objects.bulk_create(
+                [models.Contact(**o) for o in contact_objects],
+                batch_size=BATCH_SIZE,
+            )
+
         print("\nStored:")
-        for contact_api_id in contact_list:
-            contact_object = centralnic.get_contact_info(contact_api_id)
-            contact = models.Contact.objects.create(**contact_object)
+        for contact in contacts:
             print(f"ID: {contact}")
@@ -1,7 +1,10 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from main import centralnic, models
 
+BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Populate domains from CentralNIC"
@@ -10,14 +13,32 @@ class Command(BaseCommand):
         domain_list = centralnic.get_domain_list()
         print(f"Domain list: {domain_list}")
 
-        for domain_name in domain_list:
-            domain_object = centralnic.get_domain_info(domain_name)
-            contact = models.Contact.objects.get(api_id=domain_object["contact_api_id"])
-            domain_instance = models.Domain(domain_name=domain_name, contact=contact)
+        domain_objects = {
+            domain_name: centralnic.get_domain_info(domain_name)
+            for domain_name in domain_list
+        }
+
+        # read contacts and write all domain batches in a single transaction
+        with transaction.atomic():
+            # fetch all referenced contacts in one query
+            contact_api_ids = {o["contact_api_id"] for o in domain_objects.values()}
+            contacts = {
+                contact.api_id: contact
+                for contact in models.Contact.objects.filter(
+                    api_id__in=contact_api_ids
+                ).defer("api_log")
+            }
+
+            domain_instances = []
+            for domain_name, domain_object in domain_objects.items():
+                contact = contacts[domain_object["contact_api_id"]]
+                domain_instance = models.Domain(
+                    domain_name=domain_name, contact=contact
+                )
+                domain_instance.nameservers = domain_object["nameserver_list"]
+                domain_instances.append(domain_instance)
+
+            models.Domain.objects.bulk_create(domain_instances, batch_size=BATCH_SIZE)
 
-            # nameservers
-            for index, nameserver_value in enumerate(domain_object["nameserver_list"]):
-                nameserver_key = f"nameserver{index}"
-                setattr(domain_instance, nameserver_key, nameserver_value)
-            domain_instance.save()
+        for domain_instance in domain_instances:
             print(f"Saved ID: {domain_instance}")
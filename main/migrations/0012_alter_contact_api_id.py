@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-10-15 13:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main", "0011_contact_owner"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contact",
+            name="api_id",
+            field=models.CharField(db_index=True, max_length=16),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.6 on 2026-10-15 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main", "0012_alter_contact_api_id"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contact",
+            name="api_log",
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="domain",
+            name="api_log",
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
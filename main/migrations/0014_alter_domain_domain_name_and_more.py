@@ -0,0 +1,29 @@
+# Generated by Django 5.0.6 on 2026-10-15 14:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main", "0013_alter_contact_api_log_alter_domain_api_log"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="domain",
+            name="domain_name",
+            field=models.CharField(db_index=True, max_length=63),
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(
+                fields=["owner", "-created_at"], name="main_contac_owner_i_639b7d_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="domain",
+            index=models.Index(
+                fields=["owner", "-created_at"], name="main_domain_owner_i_fa97ca_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-15 14:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main", "0014_alter_domain_domain_name_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="domain",
+            index=models.Index(
+                fields=["owner", "pending"], name="main_domain_owner_i_551b66_idx"
+            ),
+        ),
+    ]
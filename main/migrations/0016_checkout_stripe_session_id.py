@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-10-15 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("main", "0015_domain_main_domain_owner_i_551b66_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="checkout",
+            name="stripe_session_id",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
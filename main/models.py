@@ -40,34 +40,58 @@ class Contact(models.Model):
     country = models.CharField(max_length=150)
     phone = models.CharField(max_length=150)
     email = models.EmailField(max_length=150)
-    api_id = models.CharField(max_length=16)
-    api_log = models.CharField(max_length=1000, blank=True, null=True)
+    api_id = models.CharField(max_length=16, db_index=True)
+    api_log = models.TextField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"{self.id}: {self.api_id}: {self.first_name} {self.last_name}"
 
 
+NAMESERVER_FIELDS = ("nameserver0", "nameserver1", "nameserver2", "nameserver3")
+
+
 class Domain(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     owner = models.ForeignKey(User, on_delete=models.PROTECT)
-    domain_name = models.CharField(max_length=63)
+    domain_name = models.CharField(max_length=63, db_index=True)
     contact = models.ForeignKey(Contact, on_delete=models.PROTECT)
     nameserver0 = models.CharField(max_length=253, blank=True, null=True, default="")
     nameserver1 = models.CharField(max_length=253, blank=True, null=True, default="")
     nameserver2 = models.CharField(max_length=253, blank=True, null=True, default="")
     nameserver3 = models.CharField(max_length=253, blank=True, null=True, default="")
-    api_log = models.CharField(max_length=1000, blank=True, null=True)
+    api_log = models.TextField(blank=True, null=True)
     pending = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "-created_at"]),
+            models.Index(fields=["owner", "pending"]),
+        ]
+
     def __str__(self):
         return f"{self.id}: {self.domain_name}"
 
+    @property
+    def nameservers(self):
+        return [getattr(self, field) for field in NAMESERVER_FIELDS]
+
+    @nameservers.setter
+    def nameservers(self, values):
+        for field, value in zip(NAMESERVER_FIELDS, values):
+            setattr(self, field, value)
+
 
 class Checkout(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     domain = models.ForeignKey(Domain, on_delete=models.CASCADE)
+    stripe_session_id = models.CharField(max_length=255, blank=True, null=True)
 
     def __str__(self):
         return f"{self.id}: Checkout for {self.domain.domain_name}"
@@ -3,59 +3,378 @@ Vendored from:
 https://github.com/netim-com/netim-apirest-client-for-python
 """
 
-import json
-import httpx
-import atexit
+import asyncio
+import functools
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+import ijson
+import orjson
+
+
+HTTP_VERBS = frozenset(("get", "post", "put", "patch", "delete"))
+
+# read-only results that rarely change (TLD info, prices, whois) are kept
+# this many seconds, for at most CACHE_SIZE distinct calls per instance
+CACHE_TTL = 300.0
+CACHE_SIZE = 1024
+# client errors (unknown domain, unavailable name, ...) of the lookups that
+# opt in are kept for a shorter time, so that repeated probes of the same
+# name while a user types do not reach the API
+NEGATIVE_CACHE_TTL = 30.0
+# zone lists are read back right after edits, so they are kept only briefly
+# and forgotten by the zone functions of this instance that change them
+ZONE_CACHE_TTL = 5.0
+# with force=False, settings completed by an instance are not sent again
+# with the same values for this many seconds, as that would only repeat the
+# same operation
+APPLIED_TTL = 60.0
+
+# list responses are large and compress well, httpx decodes them transparently
+HEADERS = {
+    "Accept-Encoding": "br, gzip, deflate",
+    "Content-Type": "application/json",
+}
+
+
+def _quote(value: str) -> str:
+    """Escapes a value interpolated into a ressource path, so that a stray /
+    or space cannot route the request to another ressource."""
+    return quote(value, safe="")
+
+
+def _lower_fqdn(domain: str, subdomain: str) -> str:
+    """Returns the lowercased fqdn of subdomain in domain, lowered in one
+    pass and interned so that the records of one name share a single string."""
+    return sys.intern(f"{subdomain}.{domain}".lower())
+
+
+def _cached(method=None, *, errors: bool = False, ttl: float = CACHE_TTL):
+    """Caches the result of a read-only API function for ttl seconds,
+    keyed on its name and arguments. Failed calls are not cached, unless
+    errors is set: then client errors are cached for NEGATIVE_CACHE_TTL.
+
+    The decorated function takes an extra fresh keyword argument: with
+    fresh=True the API is always called, and its result replaces the cached
+    one.
+    """
+    if method is None:
+        return functools.partial(_cached, errors=errors, ttl=ttl)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, fresh: bool = False, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        return self._fromCache(
+            key, lambda: method(self, *args, **kwargs), fresh, errors, ttl
+        )
+
+    return wrapper
+
+
+# one connection pool shared by all APIRest instances, each instance only
+# carries its own session token in its client headers
+# GET calls are idempotent, so they are retried on network errors and
+# gateway failures, waiting RETRY_BACKOFF, then twice as long each time;
+# other verbs are never retried, as that could apply a change twice
+RETRIES = 5
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = frozenset((502, 503, 504))
+
+# connections kept open to the API; with HTTP/2 each one carries up to the
+# server's limit of concurrent streams (commonly 100), so bursts queue on
+# open connections instead of paying new handshakes
+POOL_SIZE = 32
+KEEPALIVE_EXPIRY = 90.0
+
+_transport = httpx.HTTPTransport(
+    http2=True,
+    retries=1,
+    limits=httpx.Limits(
+        max_connections=POOL_SIZE,
+        max_keepalive_connections=POOL_SIZE,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    ),
+)
 
 
 class NetimAPIException(Exception):
-    pass
+    """Error of a call to the API, with the HTTP status of its response if
+    the API responded."""
+
+    def __init__(self, message: str = "", status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(slots=True)
+class LastCall:
+    """Request and response information of the last call to the API."""
+
+    ressource: str | None = None
+    params: dict | None = None
+    verb: str | None = None
+    status: int | str | None = None
+    response: Any = None
+    error: str | None = None
+
+
+class Pipeline:
+    """Collects API calls made through it and runs them concurrently when
+    the block exits, see APIRest.pipeline.
+
+    Each call returns its index in results, which holds the result of each
+    call, or the exception it raised, once the block has exited.
+    """
+
+    __slots__ = ("_api", "_calls", "_maxWorkers", "results")
+
+    def __init__(self, api, maxWorkers: int):
+        self._api = api
+        self._calls = []
+        self._maxWorkers = maxWorkers
+        self.results = None
+
+    def __getattr__(self, name: str):
+        # fail at the call site on a typo, not when the block exits
+        getattr(self._api, name)
+
+        def schedule(*args, **kwargs) -> int:
+            self._calls.append((name, args, kwargs))
+            return len(self._calls) - 1
+
+        return schedule
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.results = self._api.batch(self._calls, self._maxWorkers)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, *args):
+        if exc_type is None:
+            self.results = await self._api.batch(self._calls, self._maxWorkers)
 
 
 class APIRest:
     """Constructor for class APIRest
 
-    Args:
-        userID (str): the ID the client uses to connect to his NETIM account.
-        secret (str): the SECRET the client uses to connect to his NETIM account.
+    Use it as a context manager, so that the session and its connections are
+    closed as soon as the work is done:
 
-    """
+        with APIRest() as api:
+            api.domainInfo("example.com")
+
+    Args:
+        poolSize (int, optional): maximum number of connections, defaults to POOL_SIZE.
+        keepaliveExpiry (float, optional): seconds an idle connection is kept, defaults to KEEPALIVE_EXPIRY.
 
-    __connected = False
-    __sessionID = None
+    The connections are shared by all instances, unless poolSize or
+    keepaliveExpiry is given: then the instance has a pool of its own.
 
-    __userID = None
-    __secret = None
-    __apiURL = None
-    __defaultLanguage = None
+    The ID and SECRET the client uses to connect to its NETIM account are
+    read from the NETIM_USERID and NETIM_SECRET environment variables.
 
-    __lastRequestParams = None
-    __lastRequestRessource = None
-    __lastHttpVerb = None
-    __lastHttpStatus = None
-    __lastResponse = None
-    __lastError = None
+    """
 
-    def __init__(self):
-        atexit.register(self.__del__)
+    __slots__ = (
+        "_client",
+        "_last",
+        "_connected",
+        "_sessionID",
+        "_sessionLock",
+        "_cache",
+        "_applied",
+        "_limits",
+        "__userID",
+        "__secret",
+        "__apiURL",
+        "__defaultLanguage",
+    )
+
+    def __init__(
+        self, poolSize: int | None = None, keepaliveExpiry: float | None = None
+    ):
+        self._limits = None
+        if poolSize is not None or keepaliveExpiry is not None:
+            self._limits = httpx.Limits(
+                max_connections=poolSize or POOL_SIZE,
+                max_keepalive_connections=poolSize or POOL_SIZE,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+                if keepaliveExpiry is None
+                else keepaliveExpiry,
+            )
+        self._client = None
+        self._last = LastCall()
+        self._connected = False
+        self._sessionID = None
+        # batch threads share the session, only one of them opens it
+        self._sessionLock = threading.Lock()
+        self._cache = {}
+        self._applied = {}
 
         self.__userID = os.environ.get("NETIM_USERID")
         self.__secret = os.environ.get("NETIM_SECRET")
         self.__apiURL = os.environ.get("NETIM_ENDPOINT")
         self.__defaultLanguage = "EN"
 
+        # all calls reuse the same keep-alive connections instead of a new
+        # TCP+TLS handshake each; with HTTP/2 concurrent calls are
+        # multiplexed over one connection
+        self._client = self._makeClient(self.__apiURL or "")
+        self._client.headers["Accept-Language"] = self.__defaultLanguage
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def __del__(self):
-        if self.__connected and self.__sessionID is not None:
+        # safety net for instances not used as a context manager
+        self.close()
+
+    def close(self) -> None:
+        """Closes the session, and the connections unless they are shared
+        with the other instances."""
+        if self._connected and self._sessionID is not None:
             self.sessionClose()
+        if self._limits is not None and self._client is not None:
+            self._client.close()
+
+    def _makeClient(self, baseURL: str):
+        if self._limits is None:
+            transport = _transport
+        else:
+            transport = httpx.HTTPTransport(http2=True, retries=1, limits=self._limits)
+        return httpx.Client(
+            transport=transport,
+            base_url=baseURL,
+            headers=HEADERS,
+            timeout=httpx.Timeout(connect=10.0, read=60.0, write=60.0, pool=60.0),
+        )
+
+    def _fromCache(self, key: tuple, fetch, fresh: bool, errors: bool, ttl: float):
+        if not fresh:
+            hit = self._lookup(key)
+            if hit is not None:
+                return hit[0]
+        try:
+            result = fetch()
+        except NetimAPIException as exception:
+            if errors:
+                self._storeError(key, exception)
+            raise
+        self._store(key, result, ttl)
+        return result
+
+    def _lookup(self, key: tuple) -> tuple | None:
+        """Returns a 1-tuple of the cached result of key, None on a miss.
+
+        Raises:
+            NetimAPIException: if the cached result is an error.
+        """
+        hit = self._cache.get(key)
+        if hit is None or hit[0] <= time.monotonic():
+            return None
+        if isinstance(hit[1], NetimAPIException):
+            raise self._error(str(hit[1]), hit[1].status)
+        return (hit[1],)
+
+    def _store(self, key: tuple, result, ttl: float) -> None:
+        self._cache.pop(key, None)
+        if len(self._cache) >= CACHE_SIZE:
+            # drop the oldest entry, dicts keep insertion order
+            self._cache.pop(next(iter(self._cache)), None)
+        self._cache[key] = (time.monotonic() + ttl, result)
+
+    def _storeError(self, key: tuple, exception: NetimAPIException) -> None:
+        # server errors and expired sessions are not an answer about the name;
+        # the status is the exception's, as concurrent calls share _last
+        status = exception.status
+        if status is not None and 400 <= status < 500 and status != 401:
+            self._store(key, exception, NEGATIVE_CACHE_TTL)
+
+    def _callUnlessApplied(
+        self, ressource: str, httpVerb: str, params: dict, force: bool
+    ):
+        if not force:
+            response = self._appliedResponse(ressource, params)
+            if response is not None:
+                return response
+        result = self.call(ressource, httpVerb, params)
+        self._storeApplied(ressource, params, result)
+        return result
+
+    def _storeApplied(self, ressource: str, params: dict, result) -> None:
+        # only completed operations are applied, failed or pending ones are
+        # sent again
+        if isinstance(result, dict) and str(result.get("STATUS")).lower() == "done":
+            self._applied[ressource] = (time.monotonic() + APPLIED_TTL, params, result)
+
+    def _callForgettingApplied(
+        self, domain: str, ressource: str, httpVerb: str, params: dict
+    ):
+        # the other functions that set the DNS servers or DNSSEC of domain
+        # make the values applied by domainChangeDNS and domainSetDNSSec stale
+        try:
+            return self.call(ressource, httpVerb, params)
+        finally:
+            for applied in ("dns", "dnssec"):
+                self._applied.pop(f"domain/{_quote(domain)}/{applied}/", None)
+
+    def _appliedResponse(self, ressource: str, params: dict):
+        """Returns the response of the call that set the same params on
+        ressource less than APPLIED_TTL seconds ago, None otherwise."""
+        applied = self._applied.get(ressource)
+        if applied is None or applied[0] <= time.monotonic() or applied[1] != params:
+            return None
+        return applied[2]
+
+    def _forgetZone(self, fqdn: str) -> None:
+        """Forgets the cached zone lists of fqdn and of the names above it,
+        which include its records."""
+        for key in list(self._cache):
+            if key[0] != "_webHostingZoneList":
+                continue
+            name = key[1][0]
+            if name == fqdn or fqdn.endswith(f".{name}"):
+                # batch threads may forget the same list at once
+                self._cache.pop(key, None)
+
+    def _callForgettingZone(
+        self, fqdn: str, ressource: str, httpVerb: str, params: dict
+    ):
+        # forgotten once the change is made, so that a list read while it
+        # was in flight is not kept
+        try:
+            return self.call(ressource, httpVerb, params)
+        finally:
+            self._forgetZone(fqdn)
+
+    def clearCache(self) -> None:
+        """Forgets the cached results of the read-only API functions and the
+        settings applied by this instance."""
+        self._cache.clear()
+        self._applied.clear()
 
-    def __isSessionOpen(self, ressource: str, httpVerb: str):
+    def _isSessionOpen(self, ressource: str, httpVerb: str):
         return "session" in ressource and httpVerb == "post"
 
-    def __isSessionClose(self, ressource: str, httpVerb: str):
+    def _isSessionClose(self, ressource: str, httpVerb: str):
         return "session" in ressource and httpVerb == "delete"
 
-    def call(self, ressource: str, httpVerb: str, params: dict = {}):
+    def call(self, ressource: str, httpVerb: str, params: dict | None = None):
         """Launches a function of the API, abstracting the connect/disconnect part to one place
 
         Example 1: API command returning a StructOperationResponse
@@ -72,7 +391,7 @@ class APIRest:
 
         Args:
             ressource (str): name of a ressource in the API.
-            params (dict): the parameters of ressource.
+            params (dict, optional): the parameters of ressource, no body is sent if None.
             httpVerb (str): the http verb for the request (get, post, put, patch, delete).
 
         Raises:
@@ -82,80 +401,211 @@ class APIRest:
             dict: the result of the call of ressource with parameters param and http verb httpVerb.
         """
         httpVerb = httpVerb.lower()
-        self.__lastRequestRessource = ressource
-        self.__lastRequestParams = params
-        self.__lastHttpVerb = httpVerb
-        self.__lastHttpStatus = ""
-        self.__lastResponse = ""
-        self.__lastError = ""
+        self._startCall(ressource, httpVerb, params)
+        # opening a session is a call of its own, the last call is this one
+        last = self._last
 
-        try:
-            # login
-            if not self.__connected:
-                if self.__isSessionClose(ressource, httpVerb):
-                    return
-                elif not self.__isSessionOpen(ressource, httpVerb):
-                    self.sessionOpen()
-            elif self.__connected and self.__isSessionOpen(ressource, httpVerb):
+        # login
+        if not self._connected:
+            if self._isSessionClose(ressource, httpVerb):
                 return
+            elif not self._isSessionOpen(ressource, httpVerb):
+                self.sessionOpen()
+                self._last = last
+        elif self._connected and self._isSessionOpen(ressource, httpVerb):
+            return
+
+        # Call the REST ressource
+        request = self._requestArgs(ressource, httpVerb, params)
+        sessionID = self._sessionID
+        response = self._send(httpVerb, request)
+        if self._isExpired(ressource, httpVerb, response):
+            # the session expired, open a new one on the same connection and
+            # send the already encoded request again; concurrent calls that
+            # saw the same expiry reuse the session opened by the first one
+            with self._sessionLock:
+                if self._sessionID == sessionID:
+                    self._connected = False
+            self.sessionOpen()
+            self._last = last
+            response = self._send(httpVerb, request)
+        return self._finishCall(ressource, httpVerb, response)
+
+    def _send(self, httpVerb: str, request: dict) -> httpx.Response:
+        """Sends request, retrying GET calls as described at RETRIES."""
+        retries = RETRIES if httpVerb == "get" else 0
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                response = self._client.request(**request)
+            except httpx.TransportError:
+                if attempt == retries:
+                    raise
+                continue
+            if attempt == retries or response.status_code not in RETRY_STATUSES:
+                return response
 
-            # Call the REST ressource
-            if self.__isSessionOpen(ressource, httpVerb):
-                headers = {
-                    "Accept-Language": self.__defaultLanguage,
-                    "Content-Type": "application/json",
-                }
-                response = httpx.post(
-                    self.__apiURL + "/session",
-                    auth=(self.__userID, self.__secret),
-                    headers=headers,
-                )
-            else:
-                headers = {
-                    "Authorization": "Bearer " + self.__sessionID,
-                    "Content-type": "application/json",
-                }
-                function = getattr(httpx, httpVerb)
-                response = function(
-                    self.__apiURL + "/" + ressource,
-                    headers=headers,
-                    data=json.dumps(params),
-                )
-            self.__lastHttpStatus = response.status_code
+    def call_stream(self, ressource: str, httpVerb: str, item_prefix: str = "item"):
+        """Launches a function of the API returning a list, yielding its items as
+        they are parsed from the response instead of buffering the whole body.
 
+        Args:
+            ressource (str): name of a ressource in the API.
+            httpVerb (str): the http verb for the request (get, post, put, patch, delete).
+            item_prefix (str): ijson prefix of the items to yield.
+
+        Raises:
+            NetimAPIException: if the API responded with an error.
+
+        Yields:
+            the items of the list returned by ressource.
+        """
+        httpVerb = httpVerb.lower()
+        self._startCall(ressource, httpVerb, None)
+        last = self._last
+
+        # login
+        if not self._connected:
+            self.sessionOpen()
+            self._last = last
+
+        with self._client.stream(
+            **self._requestArgs(ressource, httpVerb, None)
+        ) as response:
+            if not response.is_success:
+                response.read()
+                self._finishCall(ressource, httpVerb, response)
+            self._last.status = response.status_code
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, item_prefix)
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                yield from items
+                del items[:]
+            parser.close()
+            yield from items
+
+    def _isExpired(self, ressource: str, httpVerb: str, response: httpx.Response):
+        return (
+            response.status_code == 401
+            and not self._isSessionOpen(ressource, httpVerb)
+            and not self._isSessionClose(ressource, httpVerb)
+        )
+
+    def batch(self, calls: list, max_workers: int = 16) -> list:
+        """Runs independent API functions concurrently over the shared connections.
+
+        Example:
+            api.batch([("domainWhois", (domain,), {}) for domain in domains])
+
+        Args:
+            calls (list): (name, args, kwargs) of each API function to run.
+            max_workers (int, optional): maximum number of calls in flight. Defaults to 16.
+
+        Returns:
+            list: in the order of calls, the result of each call or the exception it raised.
+            The getLast* functions do not describe any particular call afterwards.
+        """
+        # open the session once, instead of once per concurrent first call
+        if not self._connected:
+            self.sessionOpen()
+
+        def run(call):
+            name, args, kwargs = call
             try:
-                result = json.loads(response.text)
-            except json.decoder.JSONDecodeError:
-                raise NetimAPIException("Unknown error")
-
-            if self.__isSessionClose(ressource, httpVerb):
-                if response.status_code == 200:
-                    self.__connected = False
-                elif response.status_code == 401:
-                    pass
-                else:
-                    raise NetimAPIException(result["message"])
-            elif self.__isSessionOpen(ressource, httpVerb):
-                if response.status_code == 200:
-                    self.__sessionID = result["access_token"]
-                    self.__connected = True
-                else:
-                    raise NetimAPIException(result["message"])
+                return getattr(self, name)(*args, **kwargs)
+            except Exception as exception:
+                return exception
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run, calls))
+
+    def pipeline(self, max_workers: int = 16) -> Pipeline:
+        """Returns a context manager whose API functions are queued and run
+        concurrently by batch when the block exits:
+
+            with api.pipeline() as pipeline:
+                for record in records:
+                    pipeline.domainZoneCreate(domain, *record)
+            results = pipeline.results
+
+        AsyncAPIRest pipelines are used with async with.
+        """
+        return Pipeline(self, max_workers)
+
+    def _startCall(self, ressource: str, httpVerb: str, params: dict | None):
+        """Resets the last request information before a call.
+
+        Raises:
+            NetimAPIException: if httpVerb is not supported.
+        """
+        self._last = LastCall(ressource, params, httpVerb, "", "", "")
+        if httpVerb not in HTTP_VERBS:
+            raise self._error(f"Invalid http verb: {httpVerb}")
+
+    def _error(self, message: str, status: int | None = None) -> NetimAPIException:
+        """Records message as the error of the last call and returns the
+        exception to raise, with the HTTP status of the response if any."""
+        self._last.error = message
+        return NetimAPIException(message, status)
+
+    def _requestArgs(self, ressource: str, httpVerb: str, params: dict | None) -> dict:
+        """Returns the arguments of the HTTP request for a call, shared by the
+        sync and async clients."""
+        if self._isSessionOpen(ressource, httpVerb):
+            return {
+                "method": "POST",
+                "url": "session",
+                "auth": (self.__userID, self.__secret),
+            }
+        # the session token is set on the client headers once it is opened
+        return {
+            "method": httpVerb.upper(),
+            "url": ressource,
+            "content": None if params is None else orjson.dumps(params),
+        }
+
+    def _finishCall(self, ressource: str, httpVerb: str, response: httpx.Response):
+        """Decodes the response of a call and updates the session state.
+
+        Raises:
+            NetimAPIException: if the API responded with an error.
+        """
+        self._last.status = response.status_code
+
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            raise self._error("Unknown error", response.status_code)
+
+        if self._isSessionClose(ressource, httpVerb):
+            if response.status_code == 200:
+                self._connected = False
+                self._client.headers.pop("Authorization", None)
+            elif response.status_code == 401:
+                pass
             else:
-                # Code doesn't start with "2xx"
-                if response.status_code < 200 or response.status_code > 299:
-                    if response.status_code == 401:
-                        self.__connected = False
-                    if "message" in result:
-                        raise NetimAPIException(result["message"])
-                    else:
-                        raise NetimAPIException("")
-
-            self.__lastResponse = result
-        except NetimAPIException as exception:
-            self.__lastError = str(exception)
-            raise exception
+                raise self._error(result["message"], response.status_code)
+        elif self._isSessionOpen(ressource, httpVerb):
+            if response.status_code == 200:
+                self._sessionID = result["access_token"]
+                self._connected = True
+                self._client.headers["Authorization"] = f"Bearer {self._sessionID}"
+            else:
+                raise self._error(result["message"], response.status_code)
+        else:
+            # Code doesn't start with "2xx"
+            if response.status_code < 200 or response.status_code > 299:
+                if response.status_code == 401:
+                    self._connected = False
+                if "message" in result:
+                    raise self._error(result["message"], response.status_code)
+                else:
+                    raise self._error("", response.status_code)
 
+        self._last.response = result
         return result
 
     """
@@ -163,22 +613,22 @@ class APIRest:
     """
 
     def getLastRequestParams(self):
-        return self.__lastRequestParams
+        return self._last.params
 
     def getLastRequestRessource(self):
-        return self.__lastRequestRessource
+        return self._last.ressource
 
     def getLastHttpVerb(self):
-        return self.__lastHttpVerb
+        return self._last.verb
 
     def getLastHttpStatus(self):
-        return self.__lastHttpStatus
+        return self._last.status
 
     def getLastResponse(self):
-        return self.__lastResponse
+        return self._last.response
 
     def getLastError(self):
-        return self.__lastError
+        return self._last.error
 
     """
     API FUNCTIONS
@@ -190,16 +640,18 @@ class APIRest:
         Raises:
             NetimAPIException: if failed to connect.
         """
-        self.call("session", "post")
+        with self._sessionLock:
+            if not self._connected:
+                self.call("session", "post")
 
     def sessionClose(self) -> None:
-        if self.__connected and self.__sessionID is not None:
+        if self._connected and self._sessionID is not None:
             self.call("session", "delete")
-            if self.__lastHttpStatus != 200:
-                raise NetimAPIException(self.__lastError)
+            if self._last.status != 200:
+                raise NetimAPIException(self._last.error)
             else:
-                self.__sessionID = None
-        self.__connected = False
+                self._sessionID = None
+        self._connected = False
 
     def sessionInfo(self) -> dict:
         """Return the information of the current session.
@@ -214,7 +666,7 @@ class APIRest:
             sessionInfo API https://support.netim.com/en/wiki/SessionInfo
 
         """
-        if not self.__connected:
+        if not self._connected:
             raise NetimAPIException("Not connected")
         return self.call("session/", "get")
 
@@ -229,6 +681,10 @@ class APIRest:
         """
         return self.call("sessions/", "get")
 
+    def queryAllSessionsIter(self):
+        """Same as queryAllSessions, yielding sessions as they are received."""
+        return self.call_stream("sessions/", "get")
+
     def sessionSetPreference(self, type: str, value: str) -> None:
         """Updates the settings of the current session.
 
@@ -291,7 +747,7 @@ class APIRest:
             StructContactReturn API http://support.netim.com/en/wiki/StructContactReturn
         """
 
-        return self.call("contact/" + id, "get")
+        return self.call(f"contact/{_quote(id)}", "get")
 
     def contactUpdate(self, id: str, contact: dict) -> dict:
         """Edit contact details
@@ -311,7 +767,7 @@ class APIRest:
         """
 
         params = {"contact": contact}
-        return self.call("contact/" + id, "patch", params)
+        return self.call(f"contact/{_quote(id)}", "patch", params)
 
     def contactDelete(self, id: str) -> dict:
         """Deletes a contact object
@@ -330,7 +786,7 @@ class APIRest:
             StructOperationResponse API http://support.netim.com/en/wiki/StructOperationResponse
         """
 
-        return self.call("contact/" + id, "delete")
+        return self.call(f"contact/{_quote(id)}", "delete")
 
     def queryOpe(self, id: str) -> dict:
         """Query informations about the state of an operation
@@ -348,7 +804,7 @@ class APIRest:
             queryOpe API http://support.netim.com/en/wiki/QueryOpe
         """
 
-        return self.call("operation/" + id, "get")
+        return self.call(f"operation/{_quote(id)}", "get")
 
     def cancelOpe(self, id: str) -> None:
         """Cancel a pending operation
@@ -366,7 +822,7 @@ class APIRest:
             cancelOpe http://support.netim.com/en/wiki/CancelOpe
         """
 
-        self.call("operation/" + id + "/cancel/", "patch")
+        self.call(f"operation/{_quote(id)}/cancel/", "patch")
 
     def queryOpeList(self, tld: str) -> dict:
         """Returns the status (opened/closed) for all operations for the extension
@@ -383,7 +839,7 @@ class APIRest:
         See:
             queryOpeList API https://support.netim.com/en/wiki/QueryOpeList
         """
-        return self.call("tld/" + tld + "/operations/", "get")
+        return self.call(f"tld/{_quote(tld)}/operations/", "get")
 
     def queryOpePending(self) -> list:
         """Returns the list of pending operations processing
@@ -399,6 +855,10 @@ class APIRest:
         """
         return self.call("operations/pending/", "get")
 
+    def queryOpePendingIter(self):
+        """Same as queryOpePending, yielding operations as they are received."""
+        return self.call_stream("operations/pending/", "get")
+
     def queryContactList(self, filter: str = "", field: str = "") -> list:
         """Returns all contacts linked to the reseller account.
 
@@ -418,7 +878,16 @@ class APIRest:
         if not filter and not field:
             return self.call("contacts/", "get")
         else:
-            return self.call("contacts/" + field + "/" + filter + "/", "get")
+            return self.call(f"contacts/{_quote(field)}/{_quote(filter)}/", "get")
+
+    def queryContactListIter(self, filter: str = "", field: str = ""):
+        """Same as queryContactList, yielding contacts as they are received."""
+        if not filter and not field:
+            return self.call_stream("contacts/", "get")
+        else:
+            return self.call_stream(
+                f"contacts/{_quote(field)}/{_quote(filter)}/", "get"
+            )
 
     def hostCreate(self, host: str, ipv4: list, ipv6: list) -> dict:
         """Creates a new host at the registry
@@ -459,7 +928,7 @@ class APIRest:
         See:
             hostDelete API https://support.netim.com/en/wiki/HostDelete
         """
-        return self.call("host/" + host, "delete")
+        return self.call(f"host/{_quote(host)}", "delete")
 
     def hostUpdate(self, host: str, ipv4: list, ipv6: list) -> dict:
         """Updates a host at the registry
@@ -482,7 +951,7 @@ class APIRest:
             "ipv4": ipv4,
             "ipv6": ipv6,
         }
-        return self.call("host/" + host, "patch", params)
+        return self.call(f"host/{_quote(host)}", "patch", params)
 
     def queryHostList(self, filter: str) -> list:
         """Returns all hosts linked to the reseller account.
@@ -499,7 +968,11 @@ class APIRest:
         See:
             queryHostList API http://support.netim.com/en/wiki/QueryHostList
         """
-        return self.call("hosts/" + filter, "get")
+        return self.call(f"hosts/{_quote(filter)}", "get")
+
+    def queryHostListIter(self, filter: str):
+        """Same as queryHostList, yielding hosts as they are received."""
+        return self.call_stream(f"hosts/{_quote(filter)}", "get")
 
     def domainCheck(self, domain: str) -> list:
         """Checks if domain names are available for registration
@@ -521,7 +994,7 @@ class APIRest:
 
         domain = domain.lower()
 
-        return self.call("domain/" + domain + "/check/", "get")
+        return self.call(f"domain/{_quote(domain)}/check/", "get")
 
     def domainCreate(
         self,
@@ -581,7 +1054,9 @@ class APIRest:
         if templateDNS is not None:
             params["templateDNS"] = templateDNS
 
-        return self.call("domain/" + domain + "/", "post", params)
+        return self._callForgettingApplied(
+            domain, f"domain/{_quote(domain)}/", "post", params
+        )
 
     def domainInfo(self, domain: str) -> dict:
         """Returns all informations about a domain name
@@ -598,7 +1073,7 @@ class APIRest:
 
         domain = domain.lower()
 
-        return self.call("domain/" + domain + "/info/", "get")
+        return self.call(f"domain/{_quote(domain)}/info/", "get")
 
     def domainCreateLP(
         self,
@@ -656,7 +1131,7 @@ class APIRest:
             "launchPhase": launchPhase,
         }
 
-        return self.call("domain/" + domain + "/lp/", "post", params)
+        return self.call(f"domain/{_quote(domain)}/lp/", "post", params)
 
     def domainDelete(self, domain: str, typeDelete: str = "NOW") -> dict:
         """Deletes immediately a domain name
@@ -679,7 +1154,9 @@ class APIRest:
 
         params = {"typeDelete": typeDelete.upper()}
 
-        return self.call("domain/" + domain + "/", "delete", params)
+        return self._callForgettingApplied(
+            domain, f"domain/{_quote(domain)}/", "delete", params
+        )
 
     def domainTransferIn(
         self,
@@ -735,7 +1212,9 @@ class APIRest:
             "ns5": ns5,
         }
 
-        return self.call("domain/" + domain + "/transfer/", "post", params)
+        return self._callForgettingApplied(
+            domain, f"domain/{_quote(domain)}/transfer/", "post", params
+        )
 
     def domainTransferTrade(
         self,
@@ -791,7 +1270,9 @@ class APIRest:
             "ns5": ns5,
         }
 
-        return self.call("domain/" + domain + "/transfer-trade/", "post", params)
+        return self._callForgettingApplied(
+            domain, f"domain/{_quote(domain)}/transfer-trade/", "post", params
+        )
 
     def domainInternalTransfer(
         self,
@@ -843,7 +1324,9 @@ class APIRest:
             "ns5": ns5,
         }
 
-        return self.call("domain/" + domain + "/internal-transfer/", "patch", params)
+        return self._callForgettingApplied(
+            domain, f"domain/{_quote(domain)}/internal-transfer/", "patch", params
+        )
 
     def domainRenew(self, domain: str, duration: int) -> dict:
         """Renew a domain name for a new subscription period
@@ -864,7 +1347,7 @@ class APIRest:
         domain = domain.lower()
         params = {"duration": str(duration)}
 
-        return self.call("domain/" + domain + "/renew/", "patch", params)
+        return self.call(f"domain/{_quote(domain)}/renew/", "patch", params)
 
     def domainRestore(self, domain: str) -> dict:
         """Restores a domain name in quarantine / redemption status
@@ -882,7 +1365,7 @@ class APIRest:
             domainRenew API  http://support.netim.com/en/wiki/DomainRenew
         """
         domain = domain.lower()
-        return self.call("domain/" + domain + "/restore/", "patch")
+        return self.call(f"domain/{_quote(domain)}/restore/", "patch")
 
     def domainSetPreference(self, domain: str, codePref: str, value: str) -> dict:
         """Updates the settings of a domain name
@@ -905,7 +1388,7 @@ class APIRest:
 
         params = {"codePref": codePref, "value": value}
 
-        return self.call("domain/" + domain + "/preference/", "patch", params)
+        return self.call(f"domain/{_quote(domain)}/preference/", "patch", params)
 
     def domainTransferOwner(self, domain: str, idOwner: str) -> dict:
         """Requests the transfer of the ownership to another party
@@ -927,7 +1410,7 @@ class APIRest:
 
         params = {"idOwner": idOwner}
 
-        return self.call("domain/" + domain + "/transfer-owner/", "put", params)
+        return self.call(f"domain/{_quote(domain)}/transfer-owner/", "put", params)
 
     def domainChangeContact(
         self, domain: str, idAdmin: str, idTech: str, idBilling: str
@@ -953,10 +1436,17 @@ class APIRest:
 
         params = {"idAdmin": idAdmin, "idTech": idTech, "idBilling": idBilling}
 
-        return self.call("domain/" + domain + "/contacts/", "put", params)
+        return self.call(f"domain/{_quote(domain)}/contacts/", "put", params)
 
     def domainChangeDNS(
-        self, domain: str, ns1: str, ns2: str, ns3: str, ns4: str, ns5: str
+        self,
+        domain: str,
+        ns1: str,
+        ns2: str,
+        ns3: str,
+        ns4: str,
+        ns5: str,
+        force: bool = True,
     ) -> dict:
         """Replaces the DNS servers of the domain (redelegation)
 
@@ -967,6 +1457,7 @@ class APIRest:
             ns3 (str): name of the third dns
             ns4 (str): name of the fourth dns
             ns5 (str): name of the fifth dns
+            force (bool, optional): send the call even if the same DNS servers were set by this instance less than APPLIED_TTL seconds ago; with False the response of that completed call is returned instead. Changes made elsewhere are not seen. Defaults to True.
 
         Throws:
             NetimAPIException
@@ -981,14 +1472,17 @@ class APIRest:
 
         params = {"ns1": ns1, "ns2": ns2, "ns3": ns3, "ns4": ns4, "ns5": ns5}
 
-        return self.call("domain/" + domain + "/dns/", "put", params)
+        return self._callUnlessApplied(
+            f"domain/{_quote(domain)}/dns/", "put", params, force
+        )
 
-    def domainSetDNSSec(self, domain: str, enable: int) -> dict:
+    def domainSetDNSSec(self, domain: str, enable: int, force: bool = True) -> dict:
         """Allows to sign a domain name with DNSSEC if it uses NETIM DNS servers
 
         Args:
             domain (str): name of the domain
             enable (int): New signature value 0 : unsign 1 : sign
+            force (bool, optional): send the call even if the same value was set by this instance less than APPLIED_TTL seconds ago; with False the response of that completed call is returned instead. Changes made elsewhere are not seen. Defaults to True.
 
         Throws:
             NetimAPIException
@@ -1001,7 +1495,9 @@ class APIRest:
         """
         domain = domain.lower()
         params = {"enable": enable}
-        return self.call("domain/" + domain + "/dnssec/", "patch", params)
+        return self._callUnlessApplied(
+            f"domain/{_quote(domain)}/dnssec/", "patch", params, force
+        )
 
     def domainAuthID(self, domain: str, sendToRegistrant: int) -> dict:
         """Returns the authorization code to transfer the domain name to another registrar or to another client account
@@ -1022,7 +1518,7 @@ class APIRest:
         domain = domain.lower()
 
         params = {"sendtoregistrant": sendToRegistrant}
-        return self.call("domain/" + domain + "/authid/", "patch", params)
+        return self.call(f"domain/{_quote(domain)}/authid/", "patch", params)
 
     def domainRelease(self, domain: str) -> dict:
         """Release a domain name (managed by the reseller) to its registrant (who will become a direct customer at Netim)
@@ -1042,7 +1538,7 @@ class APIRest:
 
         domain = domain.lower()
 
-        return self.call("domain/" + domain + "/release/", "patch")
+        return self.call(f"domain/{_quote(domain)}/release/", "patch")
 
     def domainSetMembership(self, domain: str, token: str) -> dict:
         """Adds a membership to the domain name
@@ -1063,8 +1559,9 @@ class APIRest:
         domain = domain.lower()
 
         params = {"token": token}
-        return self.call("/domain/" + domain + "/membership/", "patch", params)
+        return self.call(f"domain/{_quote(domain)}/membership/", "patch", params)
 
+    @_cached
     def domainTldInfo(self, tld: str) -> dict:
         """Returns all available operations for a given TLD
 
@@ -1080,7 +1577,7 @@ class APIRest:
         See:
             domainTldInfo API http://support.netim.com/en/wiki/DomainTldInfo
         """
-        return self.call("/tld/" + tld + "/", "get")
+        return self.call(f"tld/{_quote(tld)}/", "get")
 
     def domainSetDNSSecExt(
         self,
@@ -1120,8 +1617,11 @@ class APIRest:
             "pubKey": pubKey,
         }
 
-        return self.call("/domain/" + domain + "/dnssec/", "patch", params)
+        return self._callForgettingApplied(
+            domain, f"domain/{_quote(domain)}/dnssec/", "patch", params
+        )
 
+    @_cached
     def domainWhois(self, domain: str) -> str:
         """Returns whois informations on given domain
 
@@ -1135,8 +1635,9 @@ class APIRest:
             str: information about the domain
         """
         domain = domain.lower()
-        return self.call("/domain/" + domain + "/whois/", "get")
+        return self.call(f"domain/{_quote(domain)}/whois/", "get")
 
+    @_cached
     def domainPriceList(self) -> dict:
         """Returns the list of all prices for each tld
 
@@ -1149,14 +1650,16 @@ class APIRest:
         See:
             domainPriceList API http://support.netim.com/en/wiki/DomainPriceList
         """
-        return self.call("/tlds/price-list/", "get")
+        return self.call("tlds/price-list/", "get")
 
+    @_cached(errors=True)
     def queryDomainPrice(self, domain: str, authID: str = "") -> dict:
         """Allows to know a domain's price
 
         Args:
             domain (str): name of domain
             authID (str, optional): authorisation code. Defaults to "".
+            fresh (bool, optional): skip the cache, for flows that must see the current price. Defaults to False.
 
         Throws:
             NetimAPIException
@@ -1170,15 +1673,31 @@ class APIRest:
         domain = domain.lower()
         if authID:
             params = {"authId": authID}
-            return self.call("/domain/" + domain + "/price/", "get", params)
+            return self.call(f"domain/{_quote(domain)}/price/", "get", params)
         else:
-            return self.call("/domain/" + domain + "/price/", "get")
+            return self.call(f"domain/{_quote(domain)}/price/", "get")
+
+    def queryDomainPriceMany(self, domains: list, max_workers: int = 32) -> dict:
+        """Allows to know the price of many domains at once, the calls are
+        multiplexed over the shared HTTP/2 connection, see batch.
+
+        Args:
+            domains (list): names of domain
+            max_workers (int, optional): maximum number of calls in flight, below the server's stream limit. Defaults to 32.
 
+        Returns:
+            dict: StructQueryDomainPrice of each domain, or the NetimAPIException raised for it
+        """
+        calls = [("queryDomainPrice", (domain,), {}) for domain in domains]
+        return dict(zip(domains, self.batch(calls, max_workers)))
+
+    @_cached(errors=True)
     def queryDomainClaim(self, domain: str) -> int:
         """Allows to know if there is a claim on the domain name
 
         Args:
             domain (str): name of domain
+            fresh (bool, optional): skip the cache. Defaults to False.
 
         Throws:
             NetimAPIException
@@ -1190,7 +1709,7 @@ class APIRest:
             queryDomainPrice API http://support.netim.com/en/wiki/QueryDomainPrice
         """
         domain = domain.lower()
-        return self.call("/domain/" + domain + "/claim/", "get")
+        return self.call(f"domain/{_quote(domain)}/claim/", "get")
 
     def queryDomainList(self, filter: str) -> list:
         """Returns all domains linked to the reseller account.
@@ -1207,7 +1726,11 @@ class APIRest:
         See:
             queryDomainList API http://support.netim.com/en/wiki/QueryDomainList
         """
-        return self.call("/domains/" + filter, "get")
+        return self.call(f"domains/{_quote(filter)}", "get")
+
+    def queryDomainListIter(self, filter: str):
+        """Same as queryDomainList, yielding domains as they are received."""
+        return self.call_stream(f"domains/{_quote(filter)}", "get")
 
     def domainZoneInit(self, domain: str, numTemplate: int) -> dict:
         """Resets all DNS settings from a template
@@ -1229,7 +1752,7 @@ class APIRest:
 
         params = {"numTemplate": numTemplate}
 
-        return self.call("/domain/" + domain + "/zone/init/", "patch", params)
+        return self.call(f"domain/{_quote(domain)}/zone/init/", "patch", params)
 
     def domainZoneCreate(
         self, domain: str, subdomain: str, type: str, value: str, options: dict
@@ -1261,7 +1784,7 @@ class APIRest:
             "options": options,
         }
 
-        return self.call("/domain/" + domain + "/zone/", "post", params)
+        return self.call(f"domain/{_quote(domain)}/zone/", "post", params)
 
     def domainZoneDelete(
         self, domain: str, subdomain: str, type: str, value: str
@@ -1290,7 +1813,7 @@ class APIRest:
             "value": value,
         }
 
-        return self.call("/domain/" + domain + "/zone/", "delete", params)
+        return self.call(f"domain/{_quote(domain)}/zone/", "delete", params)
 
     def domainZoneInitSoa(
         self,
@@ -1344,7 +1867,7 @@ class APIRest:
             "minimum": minimum,
         }
 
-        return self.call("/domain/" + domain + "/zone/init-soa/", "patch", params)
+        return self.call(f"domain/{_quote(domain)}/zone/init-soa/", "patch", params)
 
     def queryZoneList(self, domain: str) -> list:
         """Returns all DNS records of a domain name
@@ -1363,7 +1886,12 @@ class APIRest:
         """
         domain = domain.lower()
 
-        return self.call("/domain/" + domain + "/zone/", "get")
+        return self.call(f"domain/{_quote(domain)}/zone/", "get")
+
+    def queryZoneListIter(self, domain: str):
+        """Same as queryZoneList, yielding records as they are received."""
+        domain = domain.lower()
+        return self.call_stream(f"domain/{_quote(domain)}/zone/", "get")
 
     def domainMailFwdCreate(self, mailBox: str, recipients: str) -> dict:
         """Creates an email address forwarded to recipients
@@ -1385,7 +1913,7 @@ class APIRest:
         params = {
             "recipients": recipients,
         }
-        return self.call("/domain/" + mailBox + "/mail-forwarding/", "post", params)
+        return self.call(f"domain/{_quote(mailBox)}/mail-forwarding/", "post", params)
 
     def domainMailFwdDelete(self, mailBox: str) -> dict:
         """Deletes an email forward
@@ -1403,7 +1931,7 @@ class APIRest:
             domainMailFwdDelete API http://support.netim.com/en/wiki/DomainMailFwdDelete
         """
         mailBox = mailBox.lower()
-        return self.call("/domain/" + mailBox + "/mail-forwarding/", "delete")
+        return self.call(f"domain/{_quote(mailBox)}/mail-forwarding/", "delete")
 
     def queryMailFwdList(self, domain: str) -> list:
         """Returns all email forwards for a domain name
@@ -1421,7 +1949,7 @@ class APIRest:
             queryMailFwdList API http://support.netim.com/en/wiki/QueryMailFwdList
         """
         domain = domain.lower()
-        return self.call("/domain/" + domain + "/mail-forwardings/", "get")
+        return self.call(f"domain/{_quote(domain)}/mail-forwardings/", "get")
 
     def domainWebFwdCreate(
         self, fqdn: str, target: str, type: str, options: dict
@@ -1450,7 +1978,7 @@ class APIRest:
             "options": options,
         }
 
-        return self.call("/domain/" + fqdn + "/web-forwarding/", "post", params)
+        return self.call(f"domain/{_quote(fqdn)}/web-forwarding/", "post", params)
 
     def domainWebFwdDelete(self, fqdn: str) -> dict:
         """Removes a web forwarding
@@ -1467,7 +1995,7 @@ class APIRest:
         See:
             domainWebFwdDelete API http://support.netim.com/en/wiki/DomainWebFwdDelete
         """
-        return self.call("/domain/" + fqdn + "/web-forwarding/", "delete")
+        return self.call(f"domain/{_quote(fqdn)}/web-forwarding/", "delete")
 
     def queryWebFwdList(self, domain: str) -> list:
         """Return all web forwarding of a domain name
@@ -1486,7 +2014,7 @@ class APIRest:
             StructQueryWebFwdList https://support.netim.com/fr/wiki/StructQueryWebFwdList
         """
         domain = domain.lower()
-        return self.call("/domain/" + domain + "/web-forwardings/", "get")
+        return self.call(f"domain/{_quote(domain)}/web-forwardings/", "get")
 
     def sslCreate(
         self, prod: str, duration: int, CSRInfo: dict, validation: str
@@ -1519,7 +2047,7 @@ class APIRest:
             "validation": validation,
         }
 
-        return self.call("/ssl/", "post", params)
+        return self.call("ssl/", "post", params)
 
     def sslRenew(self, IDSSL: str, duration: int) -> dict:
         """Renew a SSL certificate for a new subscription period.
@@ -1539,7 +2067,7 @@ class APIRest:
         """
         params = {"duration": duration}
 
-        return self.call("/ssl/" + IDSSL + "/renew/", "patch", params)
+        return self.call(f"ssl/{_quote(IDSSL)}/renew/", "patch", params)
 
     def sslRevoke(self, IDSSL: str) -> dict:
         """Revokes a SSL Certificate.
@@ -1556,7 +2084,7 @@ class APIRest:
         See:
             sslRenew API http://support.netim.com/en/wiki/SslRenew
         """
-        return self.call("/ssl/" + IDSSL + "/", "delete")
+        return self.call(f"ssl/{_quote(IDSSL)}/", "delete")
 
     def sslReIssue(self, IDSSL: str, CSRInfo: dict, validation: str) -> dict:
         """Reissues a SSL Certificate.
@@ -1584,7 +2112,7 @@ class APIRest:
             "validation": validation,
         }
 
-        return self.call("/ssl/" + IDSSL + "/reissue/", "patch", params)
+        return self.call(f"ssl/{_quote(IDSSL)}/reissue/", "patch", params)
 
     def sslSetPreference(self, IDSSL: str, codePref: str, value: str) -> dict:
         """Updates the settings of a SSL certificate. Currently, only the autorenew setting can be modified.
@@ -1608,7 +2136,7 @@ class APIRest:
             "value": value,
         }
 
-        return self.call("/ssl/" + IDSSL + "/preference/", "patch", params)
+        return self.call(f"ssl/{_quote(IDSSL)}/preference/", "patch", params)
 
     def sslInfo(self, IDSSL: str) -> dict:
         """Returns all the informations about a SSL certificate
@@ -1625,7 +2153,7 @@ class APIRest:
         See:
             sslInfo API http://support.netim.com/en/wiki/SslInfo
         """
-        return self.call("/ssl/" + IDSSL + "/", "get")
+        return self.call(f"ssl/{_quote(IDSSL)}/", "get")
 
     def webHostingCreate(
         self, fqdn: str, offer: str, duration: int, cms: dict = {}
@@ -1651,7 +2179,7 @@ class APIRest:
             "cms": cms,
         }
 
-        return self.call("/webhosting/", "post", params)
+        return self.call("webhosting/", "post", params)
 
     def webHostingGetID(self, fqdn: str) -> str:
         """Get the unique ID of the hosting
@@ -1665,7 +2193,7 @@ class APIRest:
         Returns:
             str: the unique ID of the hosting
         """
-        return self.call("/webhosting/get-id/" + fqdn, "get")
+        return self.call(f"webhosting/get-id/{_quote(fqdn)}", "get")
 
     def webHostingInfo(self, id: str, additionalData: list) -> dict:
         """Get informations about web hosting (generic infos, MUTU platform infos, ISPConfig ...)
@@ -1685,7 +2213,7 @@ class APIRest:
             "additionalData": additionalData,
         }
 
-        return self.call("/webhosting/" + id, "get", params)
+        return self.call(f"webhosting/{_quote(id)}", "get", params)
 
     def webHostingRenew(self, id: str, duration: int) -> dict:
         """Renew a webhosting
@@ -1704,7 +2232,18 @@ class APIRest:
             "duration": duration,
         }
 
-        return self.call("/webhosting/" + id + "/renew/", "patch", params)
+        return self.call(f"webhosting/{_quote(id)}/renew/", "patch", params)
+
+    def _webHostingUpdate(self, segment: str, id: str, action: str, fparams: dict):
+        """Applies action to the segment ressource of a webhosting, or to the
+        webhosting itself if segment is empty; all the webHosting*Update
+        functions share this body."""
+        ressource = (
+            f"webhosting/{_quote(id)}/{segment}/"
+            if segment
+            else f"webhosting/{_quote(id)}"
+        )
+        return self.call(ressource, "patch", {"action": action, "params": fparams})
 
     def webHostingUpdate(self, id: str, action: str, fparams: dict) -> dict:
         """Updates a webhosting
@@ -1720,9 +2259,7 @@ class APIRest:
         Returns:
             dict: giving information on the status of the operation
         """
-        params = {"action": action, "params": fparams}
-
-        return self.call("/webhosting/" + id, "patch", params)
+        return self._webHostingUpdate("", id, action, fparams)
 
     def webHostingDelete(self, id: str, typeDelete: str) -> dict:
         """Deletes a webhosting
@@ -1741,7 +2278,7 @@ class APIRest:
             "typeDelete": typeDelete,
         }
 
-        return self.call("/webhosting/" + id, "delete", params)
+        return self.call(f"webhosting/{_quote(id)}", "delete", params)
 
     def webHostingVhostCreate(self, id: str, fqdn: str) -> dict:
         """Creates a vhost
@@ -1760,7 +2297,7 @@ class APIRest:
             "fqdn": fqdn,
         }
 
-        return self.call("/webhosting/" + id + "/vhost/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/vhost/", "post", params)
 
     def webHostingVhostUpdate(self, id: str, action: str, fparams: dict):
         """Change settings of a vhost
@@ -1779,12 +2316,7 @@ class APIRest:
             dict: StructOperationResponse giving information on the status of the operation
         """
 
-        params = {
-            "action": action,
-            "params": fparams,
-        }
-
-        return self.call("/webhosting/" + id + "/vhost/", "patch", params)
+        return self._webHostingUpdate("vhost", id, action, fparams)
 
     def webHostingVhostDelete(self, id: str, fqdn: str) -> dict:
         """Deletes a vhost
@@ -1803,7 +2335,7 @@ class APIRest:
             "fqdn": fqdn,
         }
 
-        return self.call("/webhosting/" + id + "/vhost/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/vhost/", "delete", params)
 
     def webHostingDomainMailCreate(self, id: str, domain: str) -> dict:
         """Creates a mail domain
@@ -1822,7 +2354,7 @@ class APIRest:
             "domain": domain,
         }
 
-        return self.call("/webhosting/" + id + "/domain-mail/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/domain-mail/", "post", params)
 
     def webHostingDomainMailUpdate(self, id: str, action: str, fparams: dict) -> dict:
         """Change settings of mail domain based on the specified action
@@ -1838,12 +2370,7 @@ class APIRest:
         Returns:
             dict: StructOperationResponse giving information on the status of the operation
         """
-        params = {
-            "action": action,
-            "params": fparams,
-        }
-
-        return self.call("/webhosting/" + id + "/domain-mail/", "patch", params)
+        return self._webHostingUpdate("domain-mail", id, action, fparams)
 
     def webHostingDomainMailDelete(self, id: str, domain: str) -> dict:
         """Deletes a mail domain
@@ -1862,7 +2389,7 @@ class APIRest:
             "domain": domain,
         }
 
-        return self.call("/webhosting/" + id + "/domain-mail/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/domain-mail/", "delete", params)
 
     def webHostingSSLCertCreate(
         self, id: str, sslName: str, crt: str, key: str, ca: str, csr: str = ""
@@ -1891,7 +2418,7 @@ class APIRest:
             "csr": csr,
         }
 
-        return self.call("/webhosting/" + id + "/ssl/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/ssl/", "post", params)
 
     def webHostingSSLCertDelete(self, id: str, sslName: str) -> dict:
         """Delete a SSL certificate
@@ -1910,7 +2437,7 @@ class APIRest:
             "sslName": sslName,
         }
 
-        return self.call("/webhosting/" + id + "/ssl/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/ssl/", "delete", params)
 
     def webHostingProtectedDirCreate(
         self,
@@ -1945,7 +2472,7 @@ class APIRest:
             "password": password,
         }
 
-        return self.call("/webhosting/" + id + "/protected-dir/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/protected-dir/", "post", params)
 
     def webHostingProtectedDirUpdate(self, id: str, action: str, fparams: dict) -> dict:
         """Change settings of a protected directory
@@ -1961,12 +2488,7 @@ class APIRest:
         Returns:
             dict: StructOperationResponse giving information on the status of the operation
         """
-        params = {
-            "action": action,
-            "params": fparams,
-        }
-
-        return self.call("/webhosting/" + id + "/protected-dir/", "patch", params)
+        return self._webHostingUpdate("protected-dir", id, action, fparams)
 
     def webHostingProtectedDirDelete(
         self, id: str, fqdn: str, pathSecured: str
@@ -1989,7 +2511,7 @@ class APIRest:
             "path": pathSecured,
         }
 
-        return self.call("/webhosting/" + id + "/protected-dir/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/protected-dir/", "delete", params)
 
     def webHostingCronTaskCreate(
         self,
@@ -2038,7 +2560,7 @@ class APIRest:
             "jjj": jjj,
         }
 
-        return self.call("/webhosting/" + id + "/cron-task/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/cron-task/", "post", params)
 
     def webHostingCronTaskUpdate(self, id: str, action: str, fparams: dict):
         """Change settings of a cron task
@@ -2054,12 +2576,7 @@ class APIRest:
         Returns:
             dict: StructOperationResponse giving information on the status of the operation
         """
-        params = {
-            "action": action,
-            "params": fparams,
-        }
-
-        return self.call("/webhosting/" + id + "/cron-task/", "patch", params)
+        return self._webHostingUpdate("cron-task", id, action, fparams)
 
     def webHostingCronTaskDelete(self, id: str, idCronTask: str):
         """Delete a cron task
@@ -2078,7 +2595,7 @@ class APIRest:
             "idCronTask": idCronTask,
         }
 
-        return self.call("/webhosting/" + id + "/cron-task/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/cron-task/", "delete", params)
 
     def webHostingFTPUserCreate(
         self, id: str, username: str, password: str, rootDir: str
@@ -2103,7 +2620,7 @@ class APIRest:
             "rootDir": rootDir,
         }
 
-        return self.call("/webhosting/" + id + "/ftp-user/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/ftp-user/", "post", params)
 
     def webHostingFTPUserUpdate(self, id: str, action: str, fparams: dict) -> dict:
         """Update a FTP user
@@ -2119,12 +2636,7 @@ class APIRest:
         Returns:
             dict: StructOperationResponse giving information on the status of the operation
         """
-        params = {
-            "action": action,
-            "params": fparams,
-        }
-
-        return self.call("/webhosting/" + id + "/ftp-user/", "patch", params)
+        return self._webHostingUpdate("ftp-user", id, action, fparams)
 
     def webHostingFTPUserDelete(self, id: str, username: str):
         """Delete a FTP user
@@ -2141,7 +2653,7 @@ class APIRest:
         """
         params = {"username": username}
 
-        return self.call("/webhosting/" + id + "/ftp-user/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/ftp-user/", "delete", params)
 
     def webHostingDBCreate(self, id: str, dbName: str, version: str = "") -> dict:
         """Create a database
@@ -2162,7 +2674,7 @@ class APIRest:
             "version": version,
         }
 
-        return self.call("/webhosting/" + id + "/database/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/database/", "post", params)
 
     def webHostingDBUpdate(self, id: str, action: str, fparams: dict) -> dict:
         """Update database settings
@@ -2178,12 +2690,7 @@ class APIRest:
         Returns:
             dict: StructOperationResponse giving information on the status of the operation
         """
-        params = {
-            "action": action,
-            "fparams": fparams,
-        }
-
-        return self.call("/webhosting/" + id + "/database/", "patch", params)
+        return self._webHostingUpdate("database", id, action, fparams)
 
     def webHostingDBDelete(self, id: str, dbName: str) -> dict:
         """Delete a database
@@ -2202,7 +2709,7 @@ class APIRest:
             "dbName": dbName,
         }
 
-        return self.call("/webhosting/" + id + "/database/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/database/", "delete", params)
 
     def webHostingDBUserCreate(
         self,
@@ -2234,7 +2741,7 @@ class APIRest:
             "externalAccess": externalAccess,
         }
 
-        return self.call("/webhosting/" + id + "/database-user/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/database-user/", "post", params)
 
     def webHostingDBUserUpdate(self, id: str, action: str, fparams: dict) -> dict:
         """Update database user's settings
@@ -2250,12 +2757,7 @@ class APIRest:
         Returns:
             dict: StructOperationResponse giving information on the status of the operation
         """
-        params = {
-            "action": action,
-            "params": fparams,
-        }
-
-        return self.call("/webhosting/" + id + "/database-user/", "patch", params)
+        return self._webHostingUpdate("database-user", id, action, fparams)
 
     def webHostingDBUserDelete(self, id: str, username: str) -> dict:
         """Delete a database user
@@ -2274,7 +2776,7 @@ class APIRest:
             "username": username,
         }
 
-        return self.call("/webhosting/" + id + "/database-user/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/database-user/", "delete", params)
 
     def webHostingMailCreate(
         self, id: str, email: str, password: str, quota: int
@@ -2300,7 +2802,7 @@ class APIRest:
             "quota": quota,
         }
 
-        return self.call("/webhosting/" + id + "/mailbox/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/mailbox/", "post", params)
 
     def webHostingMailUpdate(self, id: str, action: str, fparams: dict) -> dict:
         """Update mailbox' settings
@@ -2316,12 +2818,7 @@ class APIRest:
         Returns:
             dict: StructOperationResponse giving information on the status of the operation
         """
-        params = {
-            "action": action,
-            "params": fparams,
-        }
-
-        return self.call("/webhosting/" + id + "/mailbox/", "patch", params)
+        return self._webHostingUpdate("mailbox", id, action, fparams)
 
     def webHostingMailDelete(self, id: str, email: str) -> dict:
         """Delete a mailbox
@@ -2340,7 +2837,7 @@ class APIRest:
             "email": email,
         }
 
-        return self.call("/webhosting/" + id + "/mailbox/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/mailbox/", "delete", params)
 
     def webHostingMailFwdCreate(self, id: str, source: str, destination: list) -> dict:
         """Create a mail redirection
@@ -2361,7 +2858,7 @@ class APIRest:
             "destination": destination,
         }
 
-        return self.call("/webhosting/" + id + "/mail-forwarding/", "post", params)
+        return self.call(f"webhosting/{_quote(id)}/mail-forwarding/", "post", params)
 
     def webHostingMailFwdDelete(self, id: str, source: str) -> dict:
         """Delete a mail redirection
@@ -2380,7 +2877,7 @@ class APIRest:
             "source": source,
         }
 
-        return self.call("/webhosting/" + id + "/mail-forwarding/", "delete", params)
+        return self.call(f"webhosting/{_quote(id)}/mail-forwarding/", "delete", params)
 
     def webHostingZoneInit(self, fqdn: str, profil: int) -> dict:
         """Resets all DNS settings from a template
@@ -2401,7 +2898,9 @@ class APIRest:
             "profil": profil,
         }
 
-        return self.call("/webhosting/" + fqdn + "/zone/init/", "patch", params)
+        return self._callForgettingZone(
+            fqdn, f"webhosting/{_quote(fqdn)}/zone/init/", "patch", params
+        )
 
     def webHostingZoneInitSoa(
         self,
@@ -2453,13 +2952,16 @@ class APIRest:
             "minimumUnit": minimumUnit,
         }
 
-        return self.call("/webhosting/" + fqdn + "/zone/init-soa/", "patch", params)
+        return self._callForgettingZone(
+            fqdn, f"webhosting/{_quote(fqdn)}/zone/init-soa/", "patch", params
+        )
 
-    def webHostingZoneList(self, fqdn: str) -> list:
+    def webHostingZoneList(self, fqdn: str, *, fresh: bool = False) -> list:
         """Returns all DNS records of a webhosting
 
         Args:
             fqdn (str): Fully qualified domain name
+            fresh (bool, optional): call the API even if the list is cached. Defaults to False.
 
         Throws:
             NetimAPIException
@@ -2467,7 +2969,13 @@ class APIRest:
         Returns:
             list: StructQueryZoneList
         """
-        return self.call("/webhosting/" + fqdn + "/zone/", "get")
+        # cached on the lowercased name, as the zone functions forget it
+        fqdn = fqdn.lower()
+        return self._webHostingZoneList(fqdn, fresh=fresh)
+
+    @_cached(ttl=ZONE_CACHE_TTL)
+    def _webHostingZoneList(self, fqdn: str) -> list:
+        return self.call(f"webhosting/{_quote(fqdn)}/zone/", "get")
 
     def webHostingZoneCreate(
         self, domain: str, subdomain: str, type: str, value: str, options: dict
@@ -2490,14 +2998,16 @@ class APIRest:
         See:
             StructOptionsZone API http://support.netim.com/en/wiki/StructOptionsZone
         """
-        fqdn = subdomain.lower() + "." + domain.lower()
+        fqdn = _lower_fqdn(domain, subdomain)
         params = {
             "type": type,
             "value": value,
             "options": options,
         }
 
-        return self.call("/webhosting/" + fqdn + "/zone/", "post", params)
+        return self._callForgettingZone(
+            fqdn, f"webhosting/{_quote(fqdn)}/zone/", "post", params
+        )
 
     def webHostingZoneDelete(
         self, domain: str, subdomain: str, type: str, value: str
@@ -2516,10 +3026,271 @@ class APIRest:
         Returns:
             dict: StructOperationResponse giving information on the status of the operation
         """
-        fqdn = subdomain.lower() + "." + domain.lower()
+        fqdn = _lower_fqdn(domain, subdomain)
         params = {
             "type": type,
             "value": value,
         }
 
-        return self.call("/webhosting/" + fqdn + "/zone/", "delete", params)
+        return self._callForgettingZone(
+            fqdn, f"webhosting/{_quote(fqdn)}/zone/", "delete", params
+        )
+
+    def webHostingZoneBulkCreate(self, domain: str, records: list) -> list:
+        """Creates many DNS records into the webhosting domain zonefile, the
+        calls are multiplexed over the shared HTTP/2 connection, see batch.
+
+        Args:
+            domain (str): name of the domain
+            records (list): dicts of the subdomain, type, value and options of each record, as for webHostingZoneCreate
+
+        Returns:
+            list: in the order of records, the StructOperationResponse of each record or the NetimAPIException raised for it
+        """
+        calls = [("webHostingZoneCreate", (domain,), record) for record in records]
+        return self.batch(calls)
+
+    def webHostingZoneBulkDelete(self, domain: str, records: list) -> list:
+        """Deletes many DNS records from the webhosting domain zonefile, see
+        webHostingZoneBulkCreate.
+
+        Args:
+            domain (str): name of the domain
+            records (list): dicts of the subdomain, type and value of each record, as for webHostingZoneDelete
+
+        Returns:
+            list: in the order of records, the StructOperationResponse of each record or the NetimAPIException raised for it
+        """
+        calls = [("webHostingZoneDelete", (domain,), record) for record in records]
+        return self.batch(calls)
+
+
+class AsyncAPIRest(APIRest):
+    """Asynchronous variant of APIRest built on httpx.AsyncClient.
+
+    Every API function returns an awaitable, so that independent calls can
+    run concurrently over the same client:
+
+        async with AsyncAPIRest() as api:
+            results = await asyncio.gather(*[api.domainCheck(d) for d in domains])
+
+    The *Iter functions return async iterators, used with async for.
+
+    The session is opened lazily by the first call; concurrent first calls
+    wait for that single session instead of opening one each. When used as
+    an async context manager, the session is opened in the background right
+    away, so that it overlaps with whatever the caller does before its first
+    call and that call finds a warm connection.
+    """
+
+    __slots__ = ("_sessionTask",)
+
+    def __init__(
+        self, poolSize: int | None = None, keepaliveExpiry: float | None = None
+    ):
+        super().__init__(poolSize, keepaliveExpiry)
+        self._sessionLock = asyncio.Lock()
+        self._sessionTask = None
+
+    async def __aenter__(self):
+        self._sessionTask = asyncio.create_task(self.sessionOpen())
+        # failures are raised again by the first call, which retries the open
+        self._sessionTask.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    def __enter__(self):
+        raise TypeError("AsyncAPIRest is used with async with, see aclose")
+
+    def close(self) -> None:
+        raise TypeError("AsyncAPIRest is closed with await aclose()")
+
+    def __del__(self):
+        # sessions can only be closed from a running event loop, see aclose
+        pass
+
+    def _makeClient(self, baseURL: str):
+        return httpx.AsyncClient(
+            http2=True,
+            base_url=baseURL,
+            headers=HEADERS,
+            timeout=httpx.Timeout(connect=10.0, read=60.0, write=60.0, pool=60.0),
+            # asyncio connections belong to one event loop, so never shared
+            limits=self._limits
+            or httpx.Limits(
+                max_connections=POOL_SIZE,
+                max_keepalive_connections=POOL_SIZE,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+
+    async def call(self, ressource: str, httpVerb: str, params: dict | None = None):
+        """Launches a function of the API, see APIRest.call"""
+        httpVerb = httpVerb.lower()
+        self._startCall(ressource, httpVerb, params)
+        # opening a session is a call of its own, the last call is this one
+        last = self._last
+
+        # login
+        if not self._connected:
+            if self._isSessionClose(ressource, httpVerb):
+                return
+            elif not self._isSessionOpen(ressource, httpVerb):
+                await self.sessionOpen()
+                self._last = last
+        elif self._connected and self._isSessionOpen(ressource, httpVerb):
+            return
+
+        # Call the REST ressource
+        request = self._requestArgs(ressource, httpVerb, params)
+        sessionID = self._sessionID
+        response = await self._send(httpVerb, request)
+        if self._isExpired(ressource, httpVerb, response):
+            # the session expired, open a new one on the same connection and
+            # send the already encoded request again, see APIRest.call
+            if self._sessionID == sessionID:
+                self._connected = False
+            await self.sessionOpen()
+            self._last = last
+            response = await self._send(httpVerb, request)
+        return self._finishCall(ressource, httpVerb, response)
+
+    async def _fromCache(
+        self, key: tuple, fetch, fresh: bool, errors: bool, ttl: float
+    ):
+        if not fresh:
+            hit = self._lookup(key)
+            if hit is not None:
+                return hit[0]
+        try:
+            result = await fetch()
+        except NetimAPIException as exception:
+            if errors:
+                self._storeError(key, exception)
+            raise
+        self._store(key, result, ttl)
+        return result
+
+    async def _callUnlessApplied(
+        self, ressource: str, httpVerb: str, params: dict, force: bool
+    ):
+        if not force:
+            response = self._appliedResponse(ressource, params)
+            if response is not None:
+                return response
+        result = await self.call(ressource, httpVerb, params)
+        self._storeApplied(ressource, params, result)
+        return result
+
+    async def _callForgettingApplied(
+        self, domain: str, ressource: str, httpVerb: str, params: dict
+    ):
+        try:
+            return await self.call(ressource, httpVerb, params)
+        finally:
+            for applied in ("dns", "dnssec"):
+                self._applied.pop(f"domain/{_quote(domain)}/{applied}/", None)
+
+    async def _callForgettingZone(
+        self, fqdn: str, ressource: str, httpVerb: str, params: dict
+    ):
+        try:
+            return await self.call(ressource, httpVerb, params)
+        finally:
+            self._forgetZone(fqdn)
+
+    async def _send(self, httpVerb: str, request: dict) -> httpx.Response:
+        """Sends request, see APIRest._send"""
+        retries = RETRIES if httpVerb == "get" else 0
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                response = await self._client.request(**request)
+            except httpx.TransportError:
+                if attempt == retries:
+                    raise
+                continue
+            if attempt == retries or response.status_code not in RETRY_STATUSES:
+                return response
+
+    async def call_stream(
+        self, ressource: str, httpVerb: str, item_prefix: str = "item"
+    ):
+        """Launches a function of the API returning a list, see APIRest.call_stream"""
+        httpVerb = httpVerb.lower()
+        self._startCall(ressource, httpVerb, None)
+        last = self._last
+
+        # login
+        if not self._connected:
+            await self.sessionOpen()
+            self._last = last
+
+        async with self._client.stream(
+            **self._requestArgs(ressource, httpVerb, None)
+        ) as response:
+            if not response.is_success:
+                await response.aread()
+                self._finishCall(ressource, httpVerb, response)
+            self._last.status = response.status_code
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, item_prefix)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            parser.close()
+            for item in items:
+                yield item
+
+    async def batch(self, calls: list, max_workers: int = 16) -> list:
+        """Runs independent API functions concurrently, see APIRest.batch"""
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(name, args, kwargs):
+            async with semaphore:
+                return await getattr(self, name)(*args, **kwargs)
+
+        return await asyncio.gather(
+            *[run(name, args, kwargs) for name, args, kwargs in calls],
+            return_exceptions=True,
+        )
+
+    async def queryDomainPriceMany(self, domains: list, max_workers: int = 32) -> dict:
+        """Allows to know the price of many domains at once, see APIRest.queryDomainPriceMany"""
+        calls = [("queryDomainPrice", (domain,), {}) for domain in domains]
+        return dict(zip(domains, await self.batch(calls, max_workers)))
+
+    async def aclose(self) -> None:
+        """Closes the session and the underlying connections."""
+        if self._sessionTask is not None:
+            await asyncio.wait([self._sessionTask])
+        await self.sessionClose()
+        await self._client.aclose()
+
+    async def sessionOpen(self) -> None:
+        async with self._sessionLock:
+            if not self._connected:
+                await self.call("session", "post")
+
+    async def sessionClose(self) -> None:
+        if self._connected and self._sessionID is not None:
+            await self.call("session", "delete")
+            if self._last.status != 200:
+                raise NetimAPIException(self._last.error)
+            else:
+                self._sessionID = None
+        self._connected = False
+
+    async def sessionSetPreference(self, type: str, value: str) -> None:
+        await self.call("session/", "patch", {"type": type, "value": value})
+
+    async def cancelOpe(self, id: str) -> None:
+        await self.call(f"operation/{_quote(id)}/cancel/", "patch")
@@ -3,22 +3,23 @@ from main import views
 from django.urls import path, include
 
 
+# ordered by how often they are hit, resolution tries each pattern in turn
 urlpatterns = [
     path("", views.index, name="index"),
+    # domains
+    path("domains/", views.DomainList.as_view(), name="domain_list"),
+    path("add-domain/", views.DomainCreate.as_view(), name="domain_create"),
+    path("domains/<int:pk>/edit/", views.DomainUpdate.as_view(), name="domain_update"),
     # contacts
-    path("add-contact/", views.ContactCreate.as_view(), name="contact_create"),
     path("contacts/", views.ContactList.as_view(), name="contact_list"),
+    path("add-contact/", views.ContactCreate.as_view(), name="contact_create"),
     path(
         "contacts/<int:pk>/edit/", views.ContactUpdate.as_view(), name="contact_update"
     ),
-    # domains
-    path("add-domain/", views.DomainCreate.as_view(), name="domain_create"),
-    path("domains/", views.DomainList.as_view(), name="domain_list"),
-    path("domains/<int:pk>/edit/", views.DomainUpdate.as_view(), name="domain_update"),
     # payments
     path("checkout/success/", views.checkout_success, name="checkout_success"),
     path("checkout/failure/", views.checkout_failure, name="checkout_failure"),
-    # user accounts
-    path("accounts/", include("django.contrib.auth.urls")),
+    # user accounts, create ahead of the include so it skips the auth patterns
     path("accounts/create/", views.UserCreate.as_view(), name="user_create"),
+    path("accounts/", include("django.contrib.auth.urls")),
 ]
@@ -1,21 +1,56 @@
+import functools
+from datetime import timedelta
+
 import stripe
-from django.contrib.auth import authenticate, login
+from django.contrib.auth import login
+from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import HttpResponseRedirect
 from django.conf import settings
-from django.shortcuts import render, redirect
-from django.urls import reverse_lazy
+from django.db import transaction
+from django.shortcuts import get_object_or_404, render, redirect
+from django.urls import reverse, reverse_lazy
+from django.utils import timezone
+from django.views.decorators.cache import cache_page, never_cache
 from django.views.generic import ListView
 from django.views.generic.edit import CreateView, UpdateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 
 from main import models, centralnic, forms
 
+# configured once per process instead of on every checkout
+stripe.api_key = settings.STRIPE_API_KEY
+
+
+class HttpResponseSeeOther(HttpResponseRedirect):
+    status_code = 303
+
+
+@functools.cache
+def stripe_return_urls():
+    """Returns the success and cancel URLs of Stripe checkouts, built once
+    per process; not at import, as the URLconf imports this module."""
+    return (
+        f"{settings.CANONICAL_URL}{reverse('checkout_success')}"
+        "?session_id={CHECKOUT_SESSION_ID}",
+        f"{settings.CANONICAL_URL}{reverse('checkout_failure')}",
+    )
+
 
 # Landing - public
+@never_cache
 def index(request):
     if request.user.is_authenticated:
         return redirect("domain_list")
+    # anonymous visitors all get the same page, unless it has messages for them
+    if messages.get_messages(request):
+        return render(request, "main/index.html")
+    return index_anonymous(request)
+
+
+# cached server side only, browsers must not keep it once the user logs in
+@cache_page(60 * 15)
+def index_anonymous(request):
     return render(request, "main/index.html")
 
 
@@ -30,11 +65,8 @@ class UserCreate(CreateView):
 
     def form_valid(self, form):
         self.object = form.save()
-        user = authenticate(
-            username=form.cleaned_data.get("username"),
-            password=form.cleaned_data.get("password1"),
-        )
-        login(self.request, user)
+        # the new user needs no authenticate(), which would hash the password again
+        login(self.request, self.object)
         messages.success(self.request, self.success_message)
         return HttpResponseRedirect(self.get_success_url())
 
@@ -42,9 +74,15 @@ class UserCreate(CreateView):
 # Domains
 class DomainList(LoginRequiredMixin, ListView):
     model = models.Domain
+    paginate_by = 50
 
     def get_queryset(self):
-        return models.Domain.objects.filter(owner=self.request.user, pending=False)
+        # the list only renders these, leave out api_log and the nameservers
+        return (
+            models.Domain.objects.filter(owner=self.request.user, pending=False)
+            .only("domain_name", "created_at")
+            .order_by("-created_at")
+        )
 
 
 class DomainCreate(LoginRequiredMixin, CreateView):
@@ -68,18 +106,18 @@ class DomainCreate(LoginRequiredMixin, CreateView):
         return form
 
     def form_valid(self, form):
-        # save domain instance
+        # save domain and checkout instances in one transaction
         self.object = form.save(commit=False)
         self.object.owner = self.request.user
         self.object.pending = True
-        self.object.save()
-
-        # create checkout instance
-        models.Checkout.objects.create(domain=self.object)
+        with transaction.atomic():
+            self.object.save()
+            checkout = models.Checkout.objects.create(domain=self.object)
 
         # start checkout
-        stripe.api_key = settings.STRIPE_API_KEY
+        success_url, cancel_url = stripe_return_urls()
         checkout_session = stripe.checkout.Session.create(
+            client_reference_id=str(self.object.id),
             customer_email=self.request.user.email,
             line_items=[
                 {
@@ -88,12 +126,15 @@ class DomainCreate(LoginRequiredMixin, CreateView):
                 },
             ],
             mode="payment",
-            success_url=f"{settings.CANONICAL_URL}{reverse_lazy('checkout_success')}",
-            cancel_url=f"{settings.CANONICAL_URL}{reverse_lazy('checkout_failure')}",
+            success_url=success_url,
+            # identifies the domain to clean up if this checkout is cancelled
+            cancel_url=f"{cancel_url}?domain={self.object.id}",
         )
-        response = HttpResponseRedirect(checkout_session.url)
-        response.status_code = 303
-        return response
+
+        # kept so that abandoned checkouts can be told apart from paid ones
+        checkout.stripe_session_id = checkout_session.id
+        checkout.save(update_fields=["stripe_session_id", "updated_at"])
+        return HttpResponseSeeOther(checkout_session.url)
 
 
 class DomainUpdate(LoginRequiredMixin, UpdateView):
@@ -119,9 +160,15 @@ class DomainUpdate(LoginRequiredMixin, UpdateView):
 # Contacts
 class ContactList(LoginRequiredMixin, ListView):
     model = models.Contact
+    paginate_by = 50
 
     def get_queryset(self):
-        return models.Contact.objects.filter(owner=self.request.user)
+        # the list only renders these, leave out api_log and the address
+        return (
+            models.Contact.objects.filter(owner=self.request.user)
+            .only("api_id", "first_name", "last_name")
+            .order_by("-created_at")
+        )
 
 
 class ContactCreate(LoginRequiredMixin, CreateView):
@@ -143,8 +190,26 @@ class ContactCreate(LoginRequiredMixin, CreateView):
         self.object = form.save(commit=False)
         self.object.owner = self.request.user
         self.object.save()
+
+        # a double submit posts the same data again, the later of the two
+        # contacts is dropped; the database orders them, even across workers
+        duplicate = models.Contact.objects.filter(
+            owner=self.request.user,
+            pk__lt=self.object.pk,
+            created_at__gte=self.object.created_at - timedelta(seconds=60),
+            **form.cleaned_data,
+        )
+        if duplicate.exists():
+            self.object.delete()
+            return HttpResponseRedirect(self.success_url)
+
         if settings.UPSTREAM_ENABLED:
-            centralnic.create_contact(self.object)
+            # on failure the same data can be submitted again right away
+            try:
+                centralnic.create_contact(self.object)
+            except Exception:
+                self.object.delete()
+                raise
         return super().form_valid(form)
 
 
@@ -165,29 +230,67 @@ class ContactUpdate(LoginRequiredMixin, UpdateView):
 
 
 # Payments - Stripe
+@login_required
 def checkout_success(request):
-    domain = models.Domain.objects.get(pending=True, owner=request.user)
-    checkout = models.Checkout.objects.get(domain=domain)
+    # the stripe session tells which of the user's pending domains was paid
+    session_id = request.GET.get("session_id")
+    if not session_id:
+        messages.error(request, "checkout session not found")
+        return redirect("domain_list")
+    try:
+        session = stripe.checkout.Session.retrieve(session_id)
+    except stripe.InvalidRequestError:
+        messages.error(request, "checkout session not found")
+        return redirect("domain_list")
+    if session.payment_status != "paid":
+        return redirect("checkout_failure")
+
+    # one query for the checkout, its domain and the contact to register it with
+    checkout = get_object_or_404(
+        models.Checkout.objects.select_related("domain__contact").defer(
+            "domain__api_log", "domain__contact__api_log"
+        ),
+        domain_id=session.client_reference_id,
+        domain__pending=True,
+        domain__owner=request.user,
+    )
+    domain = checkout.domain
+
+    # claim the domain in the database, so that only one of concurrent hits
+    # of the success url registers it
+    claimed = models.Domain.objects.filter(pk=domain.pk, pending=True).update(
+        pending=False, updated_at=timezone.now()
+    )
+    if claimed != 1:
+        return redirect("index")
 
     # register domain
     if settings.UPSTREAM_ENABLED:
-        centralnic.register_domain(domain)
-
-    # complete registration on success
+        # on failure the domain is pending again, and a reload retries
+        try:
+            centralnic.register_domain(domain)
+        except Exception:
+            models.Domain.objects.filter(pk=domain.pk).update(
+                pending=True, updated_at=timezone.now()
+            )
+            raise
+
+    # complete registration on success, outside of the upstream call
     checkout.delete()
-    domain.pending = False
-    domain.save()
 
     # respond with message
     messages.success(request, "registration complete")
     return redirect("index")
 
 
+@login_required
 def checkout_failure(request):
-    # cleanup pending domain and checkout instances
-    domain = models.Domain.objects.filter(pending=True)
-    domain.delete()
-    models.Checkout.objects.all().delete()
+    # cleanup the pending domain of this checkout, its checkout is deleted with it
+    domain_id = request.GET.get("domain", "")
+    if domain_id.isdigit():
+        models.Domain.objects.filter(
+            pk=domain_id, owner=request.user, pending=True
+        ).delete()
 
     # respond with message
     messages.error(request, "payment failed")